@@ -7,29 +7,94 @@ A command-line tool for taking website screenshots with advanced features.
 import os
 import sys
 import re
+import time
 import json
+import mmap
+import base64
+import queue
 import zipfile
+import threading
+import asyncio
 import argparse
+import itertools
 from datetime import datetime
+from collections import deque
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from playwright.sync_api import sync_playwright
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# URL pattern compiled once, matched against raw bytes
+_URL_PATTERN = rb'https?://[^\s<>"{}|\\^`\[\]]+'
+_URL_RE = re.compile(_URL_PATTERN, re.IGNORECASE)
+_URL_PREFIX = rb'https?://'
+_URL_DB = None
+
+class _SafeNameTable(dict):
+    """str.translate table mapping non-word characters to '_', filled lazily"""
+    def __missing__(self, code):
+        char = chr(code)
+        value = char if char.isalnum() or char in '-_.' else '_'
+        self[code] = value
+        return value
+
+# Filename sanitizer equivalent to re.sub(r'[^\w\-_\.]', '_', name)
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+# Extensions recognised as captured images
+_IMAGE_EXTS = ('.png', '.jpg', '.jpeg')
+
+# Number of files hinted to the kernel ahead of the ZIP writer
+_READAHEAD_BATCH = 32
+
+# Launch flags only understood by Chromium
+_CHROMIUM_ARGS = ['--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage']
+
+# Options shared by pooled and persistent browser contexts
+_CONTEXT_OPTIONS = {
+    'viewport': {'width': 1280, 'height': 800},
+    'java_script_enabled': True,
+    'bypass_csp': True,
+    'accept_downloads': False
+}
+
+# Resource types never needed for a viewport screenshot
+_BLOCK_TYPES = frozenset({'media', 'font'})
 
 class ProgressBar:
     def __init__(self, total, bar_length=50):
         self.total = total
         self.current = 0
         self.bar_length = bar_length
-        # Largeur maximale estimée pour effacer la ligne
-        self.max_line_width = bar_length + 100 
+        # Barres pleine et vide précalculées, découpées à chaque tick
+        self._full = "#" * bar_length
+        self._empty = "-" * bar_length
+        self._inv_total = 1.0 / total if total > 0 else 0.0
+        # Intervalle minimal entre deux rafraîchissements (secondes)
+        self.min_interval = 0.05
+        self._last_draw = 0.0
 
     def update(self, current, message=""):
         self.current = current
-        progress = current / self.total if self.total > 0 else 0
+        
+        # Limiter la fréquence d'affichage, sauf pour la dernière étape
+        now = time.monotonic()
+        if now - self._last_draw < self.min_interval and current != self.total:
+            return
+        self._last_draw = now
+        
+        progress = current * self._inv_total
         filled_length = int(self.bar_length * progress)
         
         # Barre simple (sans couleurs)
-        bar = "#" * filled_length + "-" * (self.bar_length - filled_length)
+        bar = self._full[:filled_length] + self._empty[filled_length:]
             
         # Animation selon le statut
         if "OK" in message:
@@ -48,32 +113,39 @@ class ProgressBar:
         if len(message) > max_message_length:
             message = message[:max_message_length-3] + "..."
         
-        # Construire la chaîne de progression
-        progress_str = f'[{bar}] {percent}% {status} {message}'
-        
-        # Effacer toute la ligne et revenir au début, puis écrire
-        # Utiliser une largeur d'effacement plus grande
-        sys.stdout.write('\r' + ' ' * self.max_line_width + '\r' + progress_str)
+        # Effacer la ligne (séquence ANSI) et écrire en un seul appel
+        sys.stdout.write(f'\r\x1b[2K[{bar}] {percent}% {status} {message}')
         sys.stdout.flush()  # Force l'affichage immédiat
         
     def finish(self, message="Completed!"):
         # Effacer toute la ligne et revenir au début
-        sys.stdout.write('\r' + ' ' * self.max_line_width + '\r')
+        sys.stdout.write('\r\x1b[2K')
         sys.stdout.flush()
         print(message)  # Message simple sans couleur et avec retour à la ligne
 
 class ScreenshotCLI:
-    def __init__(self, input_file=None, output_dir="screenshots", threads=4, quality=85, timeout=15000):
+    def __init__(self, input_file=None, output_dir="screenshots", threads=4, quality=85, timeout=15000,
+                 fast_encode=False, block_images=False, browser="chromium", persistent_cache=False,
+                 resume=True):
         self.input_file = input_file
         self.output_dir = output_dir
         self.threads = threads
         self.quality = quality
         self.timeout = timeout
-        self.history_file = "scan_history.json"
+        self.fast_encode = fast_encode
+        self.block_types = _BLOCK_TYPES | {'image'} if block_images else _BLOCK_TYPES
+        self.browser_name = browser
+        self.persistent_cache = persistent_cache
+        self.resume = resume
+        self.history_file = "scan_history.jsonl"
+        self.legacy_history_file = "scan_history.json"
         self.url_mapping_file = "url_mapping.json"
         self.images = []
         self.url_mapping = {}
         self.urls = []
+        self._browser = None
+        self._persistent_ctx = None
+        self._ctx_pool = None
         
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
@@ -88,14 +160,68 @@ class ScreenshotCLI:
         except Exception as e:
             print(f"[!] Mapping load error: {e}")
 
+    def dump_json(self, data):
+        """Serialize data to compact JSON bytes"""
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    def write_json(self, path, data):
+        """Write compact JSON to a temp file and atomically swap it in"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(self.dump_json(data))
+        os.replace(tmp_path, path)
+
     def save_url_mapping(self):
         """Save URL mapping to file"""
         try:
-            with open(self.url_mapping_file, 'w') as f:
-                json.dump(self.url_mapping, f, indent=2)
+            self.write_json(self.url_mapping_file, self.url_mapping)
         except Exception as e:
             print(f"[!] Mapping save error: {e}")
 
+    def find_urls_re(self):
+        """Return unique raw URL matches using the precompiled regex"""
+        matches = set()
+        with open(self.input_file, 'rb') as f:
+            for line in f:
+                matches.update(_URL_RE.findall(line))
+        return matches
+
+    def find_urls_hyperscan(self):
+        """Return unique raw URL matches, located by a Hyperscan prefix scan"""
+        global _URL_DB
+        if _URL_DB is None:
+            _URL_DB = hyperscan.Database()
+            _URL_DB.compile(
+                expressions=[_URL_PREFIX],
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+            )
+
+        # One callback per URL prefix; the regex then extends each hit in C
+        starts = []
+
+        def on_match(id, start, end, flags, context):
+            starts.append(start)
+
+        with open(self.input_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return set()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                _URL_DB.scan(mm, match_event_handler=on_match)
+
+                # Skip prefixes inside an earlier URL, as re.findall would
+                matches = set()
+                last_end = -1
+                for start in starts:
+                    if start < last_end:
+                        continue
+                    match = _URL_RE.match(mm, start)
+                    if match:
+                        last_end = match.end()
+                        matches.add(match.group())
+                return matches
+
     def read_content(self):
         """Read URLs from input file"""
         if not self.input_file:
@@ -103,14 +229,16 @@ class ScreenshotCLI:
             return []
             
         try:
-            with open(self.input_file, 'r', encoding='utf-8', errors='ignore') as f:
-                text = f.read()
-            
+            if hyperscan is not None:
+                matches = self.find_urls_hyperscan()
+            else:
+                matches = self.find_urls_re()
+
             urls = set()
             # Extract URLs
-            for match in re.findall(r'https?://[^\s<>"{}|\\^`\[\]]+', text, re.IGNORECASE):
+            for match in matches:
                 try:
-                    parsed = urlparse(match)
+                    parsed = urlparse(match.decode('utf-8', 'ignore'))
                     if parsed.netloc:
                         urls.add(f"{parsed.scheme}://{parsed.netloc}")
                 except:
@@ -120,55 +248,204 @@ class ScreenshotCLI:
             print(f"[!] Read error: {e}")
             return []
 
-    def capture_screenshot(self, url):
-        """Capture screenshot of a URL"""
+    async def block_media(self, route, request):
+        """Abort requests for heavy resource types"""
+        if request.resource_type in self.block_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def start_engine(self, p, name):
+        """Launch one browser engine, persistent or not"""
+        engine = getattr(p, name)
+        args = _CHROMIUM_ARGS if name == 'chromium' else []
+        if self.persistent_cache:
+            # The profile keeps the HTTP disk cache between URLs and runs
+            user_data_dir = os.path.join(self.output_dir, '.cache', name)
+            self._persistent_ctx = await engine.launch_persistent_context(
+                user_data_dir, headless=True, args=args, **_CONTEXT_OPTIONS
+            )
+        else:
+            self._browser = await engine.launch(headless=True, args=args)
+
+    async def launch_browser(self, p):
+        """Launch the selected browser engine, falling back to Firefox"""
         try:
-            with sync_playwright() as p:
-                # Optimized browser launch
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=['--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage']
-                )
-                
-                # Optimized context
-                context = browser.new_context(
-                    viewport={'width': 1280, 'height': 800},
-                    java_script_enabled=True,
-                    bypass_csp=True,
-                    accept_downloads=False
-                )
-                
-                # Block heavy resources
-                def block_media(route):
-                    if any(ext in route.request.url for ext in 
-                          ['.mp4', '.avi', '.webm', '.mp3', '.wav', '.ogg']):
-                        route.abort()
-                    else:
-                        route.continue_()
-                
-                context.route("**/*", block_media)
-                
-                page = context.new_page()
-                
-                # Navigate to URL
-                page.goto(url, timeout=self.timeout)
-                page.wait_for_timeout(1000)
+            await self.start_engine(p, self.browser_name)
+        except Exception as e:
+            if self.browser_name == 'firefox':
+                raise
+            print(f"[!] {self.browser_name} launch failed ({e}), falling back to firefox")
+            self.browser_name = 'firefox'
+            await self.start_engine(p, 'firefox')
 
-                safe_name = re.sub(r'[^\w\-_\.]', '_', urlparse(url).netloc)
-                filepath = os.path.join(self.output_dir, f"{safe_name}.jpg")
-                
-                # Take screenshot
-                page.screenshot(
+    async def create_context_pool(self):
+        """Create one reusable browser context per concurrent capture"""
+        pool = asyncio.Queue()
+        if self._persistent_ctx is not None:
+            # A persistent profile is a single context; its pages share it
+            await self.prepare_context(self._persistent_ctx)
+            for _ in range(self.threads):
+                pool.put_nowait(self._persistent_ctx)
+            return pool
+            
+        for _ in range(self.threads):
+            context = await self._browser.new_context(**_CONTEXT_OPTIONS)
+            await self.prepare_context(context)
+            pool.put_nowait(context)
+        return pool
+
+    async def prepare_context(self, context):
+        """Install routing and per-URL time budget on a pooled context"""
+        # Playwright enforces these deadlines itself, no Python-side timers
+        context.set_default_navigation_timeout(self.timeout)
+        context.set_default_timeout(self.timeout)
+        # Route installed once per context, not once per URL
+        await context.route("**/*", self.block_media)
+
+    async def close_context_pool(self):
+        """Close every pooled browser context"""
+        if self._ctx_pool is None:
+            return
+        contexts = set()
+        while not self._ctx_pool.empty():
+            contexts.add(self._ctx_pool.get_nowait())
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self._ctx_pool = None
+
+    async def capture_screenshot(self, url):
+        """Capture screenshot of a URL using a pooled browser context"""
+        safe_name = urlparse(url).netloc.translate(_SAFE_NAME_TABLE)
+        filepath = os.path.join(self.output_dir, f"{safe_name}.jpg")
+        
+        # Incremental scans keep captures left by a previous run
+        if self.resume and os.path.exists(filepath):
+            return True, url, filepath
+            
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
+        context = await self._ctx_pool.get()
+        page = None
+        try:
+            page = await context.new_page()
+            
+            # Navigate to URL, then give dynamic pages a bounded chance to settle
+            await page.goto(url, wait_until='domcontentloaded')
+            try:
+                await page.wait_for_load_state('networkidle', timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
+            
+            # Take screenshot
+            if self.fast_encode and self.browser_name == 'chromium':
+                await self.fast_screenshot(context, page, filepath)
+            else:
+                await page.screenshot(
                     path=filepath,
                     type='jpeg',
                     quality=self.quality,
                     full_page=False
                 )
-                
-                browser.close()
-                return True, url, filepath
+            
+            return True, url, filepath
         except Exception as e:
             return False, url, str(e)
+        finally:
+            try:
+                if page is not None:
+                    await page.close()
+                # Reused contexts must not leak cookies into the next site
+                if context is not self._persistent_ctx:
+                    await context.clear_cookies()
+            except Exception:
+                pass
+            self._ctx_pool.put_nowait(context)
+
+    async def fast_screenshot(self, context, page, filepath):
+        """Capture the viewport through a raw CDP call tuned for speed"""
+        cdp = await context.new_cdp_session(page)
+        try:
+            data = await cdp.send("Page.captureScreenshot", {
+                "format": "jpeg",
+                "quality": self.quality,
+                "optimizeForSpeed": True,
+                "captureBeyondViewport": False
+            })
+        finally:
+            await cdp.detach()
+            
+        with open(filepath, 'wb') as f:
+            f.write(base64.b64decode(data['data']))
+
+    def record_result(self, task, index, progress_bar):
+        """Record one finished capture task; return True on success"""
+        try:
+            success, url, result = task.result()
+            if success:
+                self.images.append(result)
+                self.url_mapping[os.path.basename(result)] = url
+                progress_bar.update(index, f"OK {os.path.basename(result)}")
+                return True
+                
+            # Tronquer l'URL si elle est trop longue
+            short_url = url[:20] + "..." if len(url) > 20 else url
+            progress_bar.update(index, f"ERR Failed: {short_url}")
+        except Exception as e:
+            # Tronquer le message d'erreur s'il est trop long
+            error_msg = str(e)[:20] + "..." if len(str(e)) > 20 else str(e)
+            progress_bar.update(index, f"ERR Error: {error_msg}")
+        return False
+
+    async def scan_urls(self, progress_bar):
+        """Capture all URLs with a single browser shared by every task"""
+        # Imported here so --history, --list and --export start without Playwright
+        from playwright.async_api import async_playwright
+        
+        successful_captures = 0
+        failed_captures = 0
+        
+        try:
+            async with async_playwright() as p:
+                # Launch the browser once for the whole scan
+                await self.launch_browser(p)
+                try:
+                    # The pool size bounds how many captures run at once
+                    self._ctx_pool = await self.create_context_pool()
+
+                    # Keep a sliding window of tasks instead of one per URL up front
+                    urls = iter(self.urls)
+                    pending = {asyncio.ensure_future(self.capture_screenshot(url))
+                               for url in itertools.islice(urls, 2 * self.threads)}
+                    
+                    # Process results as they complete
+                    while pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            index = successful_captures + failed_captures + 1
+                            if self.record_result(task, index, progress_bar):
+                                successful_captures += 1
+                            else:
+                                failed_captures += 1
+                                
+                        for url in itertools.islice(urls, len(done)):
+                            pending.add(asyncio.ensure_future(self.capture_screenshot(url)))
+                finally:
+                    await self.close_context_pool()
+                    if self._persistent_ctx is not None:
+                        await self._persistent_ctx.close()
+                        self._persistent_ctx = None
+                    if self._browser is not None:
+                        await self._browser.close()
+                        self._browser = None
+                    
+        except Exception as e:
+            print(f"[!] Scan error: {e}")
+            
+        return successful_captures, failed_captures
 
     def run_scan(self):
         """Run the scanning process"""
@@ -182,42 +459,12 @@ class ScreenshotCLI:
 
         print(f"[OK] Found {total} URLs to process")
         print(f"[->] Output directory: {self.output_dir}")
-        print(f"[->] Using {self.threads} threads")
+        print(f"[->] Using {self.threads} concurrent captures")
         
         # Initialize progress bar
         progress_bar = ProgressBar(total)
         
-        successful_captures = 0
-        failed_captures = 0
-        
-        try:
-            with ThreadPoolExecutor(max_workers=self.threads) as executor:
-                # Submit all tasks
-                futures = [executor.submit(self.capture_screenshot, url) for url in self.urls]
-                
-                # Process results as they complete
-                for i, future in enumerate(as_completed(futures)):
-                    try:
-                        success, url, result = future.result(timeout=60)
-                        if success:
-                            self.images.append(result)
-                            self.url_mapping[os.path.basename(result)] = url
-                            successful_captures += 1
-                            progress_bar.update(i + 1, f"OK {os.path.basename(result)}")
-                        else:
-                            failed_captures += 1
-                            # Tronquer l'URL si elle est trop longue
-                            short_url = url[:20] + "..." if len(url) > 20 else url
-                            progress_bar.update(i + 1, f"ERR Failed: {short_url}")
-                        
-                    except Exception as e:
-                        failed_captures += 1
-                        # Tronquer le message d'erreur s'il est trop long
-                        error_msg = str(e)[:20] + "..." if len(str(e)) > 20 else str(e)
-                        progress_bar.update(i + 1, f"ERR Error: {error_msg}")
-                        
-        except Exception as e:
-            print(f"[!] Scan error: {e}")
+        successful_captures, failed_captures = asyncio.run(self.scan_urls(progress_bar))
             
         # Save mappings and history
         self.save_url_mapping()
@@ -233,9 +480,7 @@ class ScreenshotCLI:
             print(f"[!] {failed_captures} captures failed")
 
     def save_to_history(self, total_urls, successful):
-        """Save scan to history"""
-        history = self.load_history()
-        
+        """Append scan to history"""
         entry = {
             "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "input_file": self.input_file,
@@ -244,24 +489,46 @@ class ScreenshotCLI:
             "successful": successful
         }
         
-        history.insert(0, entry)
-        history = history[:20]  # Keep last 20
-        
+        self.migrate_history()
+        # One compact line per scan; nothing already written is touched
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(history, f, indent=2)
+            with open(self.history_file, 'ab') as f:
+                f.write(self.dump_json(entry) + b'\n')
         except Exception as e:
             print(f"[!] History save error: {e}")
 
+    def migrate_history(self):
+        """Convert the legacy JSON history list into the log if the log doesn't exist yet"""
+        if os.path.exists(self.history_file) or not os.path.exists(self.legacy_history_file):
+            return
+        try:
+            with open(self.legacy_history_file, 'r') as f:
+                history = json.load(f)
+            # The legacy list is newest first; the log is appended oldest first
+            tmp_path = self.history_file + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                for entry in reversed(history):
+                    f.write(self.dump_json(entry) + b'\n')
+            os.replace(tmp_path, self.history_file)
+        except Exception as e:
+            print(f"[!] History migration error: {e}")
+
     def load_history(self):
-        """Load scan history"""
+        """Load the last 20 scans, newest first"""
+        self.migrate_history()
+        history = []
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
+                with open(self.history_file, 'rb') as f:
+                    lines = deque(f, maxlen=20)  # Keep last 20
+                for line in reversed(lines):
+                    try:
+                        history.append(json.loads(line))
+                    except ValueError:
+                        pass  # Skip a line cut short by an interrupted write
         except Exception as e:
             print(f"[!] History load error: {e}")
-        return []
+        return history
 
     def show_history(self):
         """Show scan history"""
@@ -284,8 +551,7 @@ class ScreenshotCLI:
         if not self.images:
             # Load existing images
             if os.path.exists(self.output_dir):
-                files = [f for f in os.listdir(self.output_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-                self.images = [os.path.join(self.output_dir, f) for f in files]
+                self.images = [path for _, path, _ in self.scan_images()]
         
         if not self.images:
             print("[!] No images to export")
@@ -299,12 +565,24 @@ class ScreenshotCLI:
         progress_bar = ProgressBar(len(self.images))
         
         try:
-            with zipfile.ZipFile(filename, 'w') as zipf:
-                for i, img_path in enumerate(self.images):
-                    zipf.write(img_path, os.path.basename(img_path))
+            # File reads run on a reader thread, bounded ahead of the writer
+            pending = queue.Queue(maxsize=8)
+            reader = threading.Thread(target=self.read_images, args=(pending,), daemon=True)
+            reader.start()
+            
+            # Screenshots are already compressed, so store them as-is
+            with zipfile.ZipFile(filename, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zipf:
+                i = 0
+                while (item := pending.get()) is not None:
+                    if isinstance(item, Exception):
+                        raise item
+                    zinfo, data = item
+                    with zipf.open(zinfo, 'w') as dst:
+                        dst.write(data)
+                    i += 1
                     # Tronquer le nom du fichier s'il est trop long
-                    short_name = os.path.basename(img_path)[:20] + "..." if len(os.path.basename(img_path)) > 20 else os.path.basename(img_path)
-                    progress_bar.update(i + 1, f"Adding {short_name}")
+                    short_name = zinfo.filename[:20] + "..." if len(zinfo.filename) > 20 else zinfo.filename
+                    progress_bar.update(i, f"Adding {short_name}")
             
             progress_bar.finish("[OK] ZIP export completed")
             print(f"[OK] ZIP export successful: {filename}")
@@ -312,21 +590,54 @@ class ScreenshotCLI:
             progress_bar.finish("[ERR] ZIP export failed")
             print(f"[!] Error during ZIP export: {e}")
 
+    def read_images(self, out_queue):
+        """Reader thread: load image files ahead of the ZIP writer"""
+        try:
+            self.prefetch_files(self.images[:_READAHEAD_BATCH])
+            for i, img_path in enumerate(self.images):
+                # Keep one batch of reads in flight ahead of the reader
+                if i % _READAHEAD_BATCH == 0:
+                    self.prefetch_files(self.images[i + _READAHEAD_BATCH:i + 2 * _READAHEAD_BATCH])
+                zinfo = zipfile.ZipInfo.from_file(img_path, os.path.basename(img_path))
+                with open(img_path, 'rb') as f:
+                    out_queue.put((zinfo, f.read()))
+            out_queue.put(None)
+        except Exception as e:
+            out_queue.put(e)
+
+    def prefetch_files(self, paths):
+        """Ask the kernel to start reading files before they are needed"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+    def scan_images(self):
+        """Return (name, path, size) for every image in the output directory"""
+        with os.scandir(self.output_dir) as it:
+            return [(e.name, e.path, e.stat().st_size) for e in it
+                    if e.name.lower().endswith(_IMAGE_EXTS) and e.is_file()]
+
     def list_images(self):
         """List all captured images"""
         if not os.path.exists(self.output_dir):
             print("[!] Output directory does not exist")
             return
             
-        files = [f for f in os.listdir(self.output_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-        if not files:
+        entries = self.scan_images()
+        if not entries:
             print("[!] No images found")
             return
             
         print(f"\n=== Images in {self.output_dir} ===")
-        for i, filename in enumerate(sorted(files)):
-            filepath = os.path.join(self.output_dir, filename)
-            size = os.path.getsize(filepath)
+        for i, (filename, _, size) in enumerate(sorted(entries)):
             print(f"[{i+1:2}] {filename} ({size//1024} KB)")
 
 def main():
@@ -337,6 +648,7 @@ def main():
 Examples:
   python screenshot_cli.py -i urls.txt
   python screenshot_cli.py -i urls.txt -o my_captures -t 6 --quality 90
+  python screenshot_cli.py -i urls.txt --fast-encode
   python screenshot_cli.py --history
   python screenshot_cli.py --export my_archive.zip
   python screenshot_cli.py --list
@@ -345,9 +657,16 @@ Examples:
     
     parser.add_argument("-i", "--input", help="Input file containing URLs")
     parser.add_argument("-o", "--output", default="screenshots", help="Output directory (default: screenshots)")
-    parser.add_argument("-t", "--threads", type=int, default=4, help="Number of threads (default: 4)")
+    parser.add_argument("-t", "--threads", type=int, default=4, help="Number of concurrent captures (default: 4)")
     parser.add_argument("--quality", type=int, default=85, help="JPEG quality 1-100 (default: 85)")
     parser.add_argument("--timeout", type=int, default=15000, help="Page timeout in ms (default: 15000)")
+    parser.add_argument("--fast-encode", action="store_true", help="Capture through CDP with optimizeForSpeed")
+    parser.add_argument("--block-images", action="store_true", help="Skip image downloads while rendering pages")
+    parser.add_argument("--browser", choices=["chromium", "firefox", "webkit"], default="chromium",
+                        help="Browser engine (default: chromium, falls back to firefox)")
+    parser.add_argument("--persistent-cache", action="store_true",
+                        help="Reuse a browser profile in <output>/.cache so repeat scans hit the disk cache")
+    parser.add_argument("--no-resume", action="store_true", help="Recapture URLs whose screenshot already exists")
     
     parser.add_argument("--history", action="store_true", help="Show scan history")
     parser.add_argument("--export", nargs="?", const="screenshots.zip", help="Export images to ZIP")
@@ -361,7 +680,12 @@ Examples:
         output_dir=args.output,
         threads=args.threads,
         quality=args.quality,
-        timeout=args.timeout
+        timeout=args.timeout,
+        fast_encode=args.fast_encode,
+        block_images=args.block_images,
+        browser=args.browser,
+        persistent_cache=args.persistent_cache,
+        resume=not args.no_resume
     )
     
     # Handle different modes
@@ -377,14 +701,4 @@ Examples:
         parser.print_help()
 
 if __name__ == "__main__":
-    # Install required packages if not present
-    try:
-        import playwright
-    except ImportError:
-        print("[!] Playwright not found. Installing...")
-        os.system("pip install playwright")
-        os.system("playwright install chromium")
-        print("[OK] Playwright installed. Please run the script again.")
-        sys.exit(1)
-    
     main()
\ No newline at end of file
@@ -6,26 +6,72 @@ A powerful tool for taking website screenshots and managing them with a beautifu
 
 import os
 import sys
-import threading
+import asyncio
 import re
+import hashlib
 import json
+import mmap
 import zipfile
 import logging
+import logging.handlers
+import functools
+import contextlib
+import itertools
+from io import BytesIO
 from datetime import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QPushButton, QLabel, QFileDialog, QProgressBar, QGroupBox,
     QStatusBar, QListWidget, QListWidgetItem, QLineEdit, QSplitter,
     QMessageBox, QInputDialog, QScrollArea, QToolBar, QTextEdit,
-    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QTextBrowser, QFrame
+    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QTextBrowser, QFrame,
+    QGraphicsColorizeEffect
 )
-from PyQt6.QtGui import QPixmap, QFont, QIcon, QAction, QKeySequence, QShortcut, QPainter, QDesktopServices, QColor
-from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal, QUrl, QSettings, QPropertyAnimation, QEasingCurve
-from playwright.sync_api import sync_playwright
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QFont, QIcon, QAction, QKeySequence, QShortcut, QPainter, QDesktopServices, QColor
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal, QUrl, QSettings, QPropertyAnimation, QEasingCurve, QObject, QRunnable, QThreadPool, QThread, QBuffer, QByteArray, QIODevice
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Log records are buffered in memory and written out in batches
+_log_file = logging.handlers.RotatingFileHandler('app.log', maxBytes=5_000_000, backupCount=3)
+_log_file.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_buffer = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=_log_file)
+logging.basicConfig(
+    level=logging.DEBUG if os.environ.get('SCREENSHOT_DEBUG') == '1' else logging.INFO,
+    handlers=[_log_buffer]
+)
+
+# Patterns compiled once at import
+_URL_PATTERN = rb'https?://[^\s<>"{}|\\^`\[\]]+'
+_URL_RE = re.compile(_URL_PATTERN, re.IGNORECASE)
+_URL_PREFIX = rb'https?://'
+_URL_DB = None
+# Scheme and host of a URL match; the host ends where urlparse's netloc would
+_ORIGIN_RE = re.compile(rb'(https?)://([^/?#]*)', re.IGNORECASE)
+_UNSAFE_NAME_RE = re.compile(r'[^\w\-_\.]')
+_MEDIA_URL_RE = re.compile(r'\.(?:mp4|avi|webm|mp3|wav|ogg)(?:[?#]|$)', re.IGNORECASE)
+
+# Size of list thumbnails, in memory and in the on-disk cache
+_THUMB_SIZE = QSize(65, 50)
+
+
+@functools.lru_cache(maxsize=8192)
+def _domain_of(url):
+    """Lowercased host of a URL, memoized since the same URLs recur"""
+    return urlparse(url).netloc.lower()
 
-logging.basicConfig(filename='app.log', level=logging.DEBUG)
 
 class AnimatedButton(QPushButton):
     """Custom button with hover animations"""
@@ -60,6 +106,11 @@ class AnimatedButton(QPushButton):
         """)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
+        # One animation reused for every hover
+        self._animation = QPropertyAnimation(self, b"geometry", self)
+        self._animation.setDuration(150)
+        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        
     def enterEvent(self, event):
         self.animate_hover(True)
         super().enterEvent(event)
@@ -70,29 +121,26 @@ class AnimatedButton(QPushButton):
         
     def animate_hover(self, entering):
         # Subtle hover animation
-        if hasattr(self, '_animation'):
-            self._animation.stop()
-            
-        self._animation = QPropertyAnimation(self, b"geometry")
-        self._animation.setDuration(150)
-        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
+        self._animation.stop()
+        current = self.geometry()
         if entering:
-            current = self.geometry()
             new = current.adjusted(-1, -1, 1, 1)
-            self._animation.setStartValue(current)
-            self._animation.setEndValue(new)
         else:
-            current = self.geometry()
-            original = current.adjusted(1, 1, -1, -1)
-            self._animation.setStartValue(current)
-            self._animation.setEndValue(original)
-            
+            new = current.adjusted(1, 1, -1, -1)
+        self._animation.setStartValue(current)
+        self._animation.setEndValue(new)
         self._animation.start()
 
 
 class ImageViewer(QGraphicsView):
     """Custom image viewer with smooth zoom and pan"""
+    # Larger images are shown as a screen-sized preview until zoomed in
+    PREVIEW_PIXELS = 4_000_000
+    # Decoded neighbours kept ready for navigation
+    PRELOAD_LIMIT = 4
+    # Recently shown pixmaps kept for going back
+    RECENT_LIMIT = 8
+    
     def __init__(self):
         super().__init__()
         self.scene = QGraphicsScene(self)
@@ -104,17 +152,121 @@ class ImageViewer(QGraphicsView):
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setBackgroundBrush(QColor(17, 17, 17))  # #111
         self.pixmap_item = None
+        self._full_res_path = None
         self.setFrameStyle(QFrame.Shape.NoFrame)
+        
+        # Background decoding of adjacent images
+        self._preloaded = OrderedDict()
+        self._preloading = set()
+        self._recent = OrderedDict()
+        self._preload_pool = QThreadPool(self)
+        self._preload_pool.setMaxThreadCount(2)
+        self._preload_signals = ThumbnailSignals(self)
+        self._preload_signals.loaded.connect(self.on_preloaded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
+        # Refit once the user stops resizing
+        self._last_fit_size = QSize()
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self.refit)
+        
+    def image_plan(self, path):
+        """Cache key and decode size for an image file (None means full size)"""
+        size = QImageReader(path).size()
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = 0
+        if not size.isValid() or size.width() * size.height() <= self.PREVIEW_PIXELS:
+            return f"{path}:{mtime}", None
+            
+        # Decode straight to about twice the on-screen size
+        bounds = self.viewport().size().expandedTo(QSize(1280, 800)) * (self.devicePixelRatioF() * 2)
+        target = size.scaled(bounds, Qt.AspectRatioMode.KeepAspectRatio).boundedTo(size)
+        return f"{path}:{mtime}:preview:{target.width()}x{target.height()}", target
+
+    def load_image(self, path):
+        """Load and display an image file, previewing very large ones"""
+        self._full_res_path = None
+        key, target = self.image_plan(path)
+        image = self._preloaded.pop(key, None)
+        pixmap = self._recent.get(key)
+        if pixmap is None and target is not None:
+            pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            if image is not None:
+                pixmap = QPixmap.fromImage(image)
+            else:
+                # Unlike QPixmap(path), this keeps the raster out of QPixmapCache
+                reader = QImageReader(path)
+                if target is not None:
+                    reader.setScaledSize(target)
+                pixmap = QPixmap.fromImageReader(reader)
+            if target is not None and not pixmap.isNull():
+                QPixmapCache.insert(key, pixmap)
+        if not pixmap.isNull():
+            self._recent[key] = pixmap
+            self._recent.move_to_end(key)
+            while len(self._recent) > self.RECENT_LIMIT:
+                self._recent.popitem(last=False)
+        self.set_image(pixmap)
+        if target is not None and self.pixmap_item:
+            self._full_res_path = path
+        return pixmap
+
+    def preload(self, paths):
+        """Decode images in the background so navigating to them is instant"""
+        for path in paths:
+            key, target = self.image_plan(path)
+            if key in self._preloaded or key in self._preloading or key in self._recent:
+                continue
+            if target is not None and QPixmapCache.find(key) is not None:
+                continue
+            self._preloading.add(key)
+            self._preload_pool.start(ImagePreloader(path, key, target, self._preload_signals))
+
+    def on_preloaded(self, path, key, image):
+        """Keep a few decoded neighbours, oldest evicted first"""
+        self._preloading.discard(key)
+        if image.isNull():
+            return
+        self._preloaded[key] = image
+        self._preloaded.move_to_end(key)
+        while len(self._preloaded) > self.PRELOAD_LIMIT:
+            self._preloaded.popitem(last=False)
+
+    def load_full_resolution(self):
+        """Swap the preview for the original image, keeping the current view"""
+        path = self._full_res_path
+        self._full_res_path = None
+        pixmap = QPixmap.fromImageReader(QImageReader(path))
+        if pixmap.isNull() or not self.pixmap_item:
+            return
+        scale = self.pixmap_item.pixmap().width() / pixmap.width()
+        self.scene.removeItem(self.pixmap_item)
+        self.release_pixmap()
+        self.pixmap_item = QGraphicsPixmapItem(pixmap)
+        self.pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        self.pixmap_item.setScale(scale)
+        self.scene.addItem(self.pixmap_item)
+
+    def release_pixmap(self):
+        """Drop the displayed raster now rather than whenever the item is collected"""
+        if self.pixmap_item is not None:
+            self.pixmap_item.setPixmap(QPixmap())
+            self.pixmap_item = None
+
     def set_image(self, pixmap):
         """Set and display an image"""
+        self.release_pixmap()
         self.scene.clear()
         if pixmap and not pixmap.isNull():
             self.pixmap_item = QGraphicsPixmapItem(pixmap)
             self.scene.addItem(self.pixmap_item)
-            self.fitInView(self.pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
+            self.fit_image()
         else:
             self.pixmap_item = None
 
@@ -122,6 +274,9 @@ class ImageViewer(QGraphicsView):
         """Handle zoom with mouse wheel"""
         if event.angleDelta().y() > 0:
             self.scale(1.1, 1.1)
+            # Preview pixels are being magnified, show the real ones
+            if self._full_res_path and self.transform().m11() > 1.0:
+                self.load_full_resolution()
         else:
             self.scale(0.9, 0.9)
 
@@ -129,26 +284,264 @@ class ImageViewer(QGraphicsView):
         """Handle resize events"""
         super().resizeEvent(event)
         if self.pixmap_item:
-            self.fitInView(self.pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
+            self._resize_timer.start()
+
+    def fit_image(self):
+        """Fit the image to the viewport"""
+        self.fitInView(self.pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
+        self._last_fit_size = self.viewport().size()
+
+    def refit(self):
+        """Refit after a resize, unless the viewport barely changed"""
+        if not self.pixmap_item:
+            return
+        size = self.viewport().size()
+        if (abs(size.width() - self._last_fit_size.width()) < 4
+                and abs(size.height() - self._last_fit_size.height()) < 4):
+            return
+        self.fit_image()
+
+
+class ThumbnailSignals(QObject):
+    """Signals emitted by background thumbnail and preload jobs"""
+    loaded = pyqtSignal(str, str, QImage)
+
+
+class ThumbnailLoader(QRunnable):
+    """Decode and scale a thumbnail off the GUI thread"""
+    def __init__(self, filepath, mtime, key, thumb_path, signals, generation, current_generation):
+        super().__init__()
+        self.filepath = filepath
+        self.mtime = mtime
+        self.key = key
+        self.thumb_path = thumb_path
+        self.signals = signals
+        self.generation = generation
+        self.current_generation = current_generation
+        self.setAutoDelete(True)
+        
+    def run(self):
+        # Skip jobs queued for a viewport the user has scrolled away from
+        if self.generation != self.current_generation():
+            return
+            
+        # Only QImage may be used outside the GUI thread
+        image = self.load_cached()
+        if image is None:
+            image = self.read_scaled(QImageReader(self.filepath))
+            if not image.isNull():
+                self.save_cached(image, self.thumb_path)
+        self.signals.loaded.emit(self.filepath, self.key, image)
+        
+    @staticmethod
+    def read_scaled(reader):
+        """Decode a thumbnail-sized image from a reader"""
+        # Let the decoder downscale (JPEG decodes at reduced size directly)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(_THUMB_SIZE, Qt.AspectRatioMode.KeepAspectRatio).boundedTo(size))
+        reader.setQuality(100)  # Smooth rather than fast scaling
+        return reader.read()
+        
+    def load_cached(self):
+        """Return the on-disk thumbnail if it is newer than the source"""
+        try:
+            if os.path.getmtime(self.thumb_path) >= self.mtime:
+                image = QImage(self.thumb_path)
+                if not image.isNull():
+                    return image
+        except OSError:
+            pass
+        return None
+        
+    @staticmethod
+    def save_cached(image, thumb_path):
+        """Write the scaled thumbnail to the disk cache"""
+        try:
+            os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+            image.save(thumb_path, "PNG", 50)
+        except OSError as e:
+            logging.debug(f"Thumbnail cache write error: {e}")
+
+
+class BrowserPool:
+    """Pre-launched browsers checked out one capture at a time, recycled after heavy use"""
+    POOL_SIZE = min(4, os.cpu_count() or 1)
+    MAX_USES_PER_INSTANCE = 50
+    LAUNCH_ARGS = ['--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage']
+    
+    def __init__(self, playwright):
+        self.playwright = playwright
+        # Idle (browser, use_count) slots; a None browser is relaunched on checkout
+        self.idle = asyncio.Queue()
+        
+    async def launch(self):
+        return await self.playwright.chromium.launch(headless=True, args=self.LAUNCH_ARGS)
+        
+    async def start(self):
+        """Launch every browser concurrently before the first capture"""
+        results = await asyncio.gather(*(self.launch() for _ in range(self.POOL_SIZE)), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logging.error(f"Browser launch error: {result}")
+                result = None
+            self.idle.put_nowait((result, 0))
+            
+    @contextlib.asynccontextmanager
+    async def checkout(self):
+        """Borrow a browser for one capture"""
+        browser, uses = await self.idle.get()
+        try:
+            if browser is None:
+                browser, uses = await self.launch(), 0
+            yield browser
+        finally:
+            if browser is not None:
+                uses += 1
+                # Recycle long-lived or crashed instances to bound memory drift
+                if uses >= self.MAX_USES_PER_INSTANCE or not browser.is_connected():
+                    await self.close_browser(browser)
+                    browser, uses = None, 0
+            self.idle.put_nowait((browser, uses))
+            
+    async def close_browser(self, browser):
+        try:
+            await browser.close()
+        except Exception as e:
+            logging.debug(f"Browser close error: {e}")
+            
+    async def shutdown(self):
+        """Close every idle browser"""
+        while not self.idle.empty():
+            browser, _ = self.idle.get_nowait()
+            if browser is not None:
+                await self.close_browser(browser)
+
+
+class ScanWorker(QObject):
+    """Runs a scan function on a QThread"""
+    finished = pyqtSignal()
+    
+    def __init__(self, scan):
+        super().__init__()
+        self.scan = scan
+        
+    def run(self):
+        try:
+            self.scan()
+        finally:
+            self.finished.emit()
+
+
+class ZipExportWorker(QObject):
+    """Writes images to a ZIP archive off the GUI thread"""
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    # Files being read ahead of the single ZIP writer
+    READ_AHEAD = 8
+    
+    def __init__(self, filename, images):
+        super().__init__()
+        self.filename = filename
+        self.images = list(images)
+        # Set from the GUI thread to stop between files; complete only once every file is written
+        self.cancelled = False
+        self.complete = False
+        
+    def run(self):
+        try:
+            # Screenshots are already compressed, store them as-is
+            with open(self.filename, 'wb', buffering=1 << 20) as f, \
+                    zipfile.ZipFile(f, 'w', zipfile.ZIP_STORED, allowZip64=True) as zipf, \
+                    ThreadPoolExecutor(max_workers=4) as executor:
+                total = len(self.images)
+                paths = iter(self.images)
+                pending = deque(executor.submit(self.read_image, path)
+                                for path in itertools.islice(paths, self.READ_AHEAD))
+                done = 0
+                while pending and not self.cancelled:
+                    zinfo, data = pending.popleft().result()
+                    pending.extend(executor.submit(self.read_image, path)
+                                   for path in itertools.islice(paths, 1))
+                    # ZipFile is not thread-safe, so only this thread writes
+                    zipf.writestr(zinfo, data)
+                    done += 1
+                    self.progress.emit(done, total)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            if not self.cancelled:
+                self.complete = True
+                self.finished.emit(self.filename)
+            
+    def read_image(self, img_path):
+        """Read one image and its ZIP entry header on a pool thread"""
+        zinfo = zipfile.ZipInfo.from_file(img_path, os.path.basename(img_path), strict_timestamps=False)
+        with open(img_path, 'rb') as f:
+            return zinfo, f.read()
+
+
+class ImagePreloader(QRunnable):
+    """Decode an image off the GUI thread ahead of navigation"""
+    def __init__(self, path, key, scaled_size, signals):
+        super().__init__()
+        self.path = path
+        self.key = key
+        self.scaled_size = scaled_size
+        self.signals = signals
+        self.setAutoDelete(True)
+        
+    def run(self):
+        reader = QImageReader(self.path)
+        if self.scaled_size is not None:
+            reader.setScaledSize(self.scaled_size)
+        self.signals.loaded.emit(self.path, self.key, reader.read())
 
 
 class ThumbnailItem(QListWidgetItem):
     """Custom thumbnail item for the list"""
-    def __init__(self, filepath, parent=None):
+    _placeholder = None
+    
+    def __init__(self, filepath, parent=None, mtime=None):
         super().__init__(parent)
         self.filepath = filepath
         self.filename = os.path.basename(filepath)
+        self.search_key = self.filename.lower()
         self.setText(self.filename)
         
-        # Create thumbnail
-        pixmap = QPixmap(filepath)
-        if not pixmap.isNull():
-            thumbnail = pixmap.scaled(65, 50, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.setIcon(QIcon(thumbnail))
+        # Thumbnail from cache, otherwise loaded in the background
+        if mtime is None:
+            try:
+                mtime = os.path.getmtime(filepath)
+            except OSError:
+                mtime = 0
+        self.mtime = mtime
+        self.thumbnail_key = self.cache_key(filepath, mtime)
+        pixmap = QPixmapCache.find(self.thumbnail_key)
+        self.needs_thumbnail = pixmap is None
+        if pixmap is not None:
+            self.setIcon(QIcon(pixmap))
+        else:
+            self.setIcon(self.placeholder_icon())
         
         # Selection style
         self.setBackground(QColor(60, 60, 60, 100))
         
+    @staticmethod
+    def cache_key(filepath, mtime):
+        """QPixmapCache key of the thumbnail for one version of a file"""
+        return f"{filepath}:{mtime}:{_THUMB_SIZE.width()}x{_THUMB_SIZE.height()}"
+        
+    @classmethod
+    def placeholder_icon(cls):
+        """Neutral icon shown until the real thumbnail is ready"""
+        if cls._placeholder is None:
+            pixmap = QPixmap(_THUMB_SIZE)
+            pixmap.fill(QColor(70, 70, 70))
+            cls._placeholder = QIcon(pixmap)
+        return cls._placeholder
+        
     def setSelected(self, selected):
         super().setSelected(selected)
         if selected:
@@ -159,59 +552,45 @@ class ThumbnailItem(QListWidgetItem):
 
 class AnimatedProgressBar(QProgressBar):
     """Custom progress bar with animations"""
+    STYLE = """
+        QProgressBar {
+            height: 14px;
+            border-radius: 7px;
+            background-color: #333;
+            border: 1px solid #444;
+            text-align: center;
+            font-size: 9px;
+            color: #fff;
+            font-weight: 500;
+        }
+        QProgressBar::chunk {
+            background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, 
+                stop: 0 #4a90e2, 
+                stop: 0.5 #5cb85c,
+                stop: 1 #5cb85c);
+            border-radius: 7px;
+        }
+        QProgressBar[state="complete"]::chunk {
+            background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, 
+                stop: 0 #5cb85c, 
+                stop: 0.5 #4cae4c,
+                stop: 1 #5cb85c);
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTextVisible(True)
-        self.setStyleSheet("""
-            QProgressBar {
-                height: 14px;
-                border-radius: 7px;
-                background-color: #333;
-                border: 1px solid #444;
-                text-align: center;
-                font-size: 9px;
-                color: #fff;
-                font-weight: 500;
-            }
-            QProgressBar::chunk {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, 
-                    stop: 0 #4a90e2, 
-                    stop: 0.5 #5cb85c,
-                    stop: 1 #5cb85c);
-                border-radius: 7px;
-            }
-        """)
-        
-    def setValue(self, value):
-        super().setValue(value)
-        # Subtle bar animation
-        if value > 0:
-            self.setStyleSheet(f"""
-                QProgressBar {{
-                    height: 14px;
-                    border-radius: 7px;
-                    background-color: #333;
-                    border: 1px solid #444;
-                    text-align: center;
-                    font-size: 9px;
-                    color: #fff;
-                    font-weight: 500;
-                }}
-                QProgressBar::chunk {{
-                    background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, 
-                        stop: 0 #4a90e2, 
-                        stop: {min(value/100 + 0.1, 1.0)} #5cb85c,
-                        stop: 1 #5cb85c);
-                    border-radius: 7px;
-                }}
-            """)
+        # Set once: restyling on every tick reparses the QSS and repolishes
+        self.setStyleSheet(self.STYLE)
 
 
 class ScreenshotViewer(QMainWindow):
     """Main application window"""
     scan_completed = pyqtSignal()
     scan_progress = pyqtSignal(int, str)
-    scan_new_image = pyqtSignal(str)
+    scan_new_images = pyqtSignal(list)
+    scan_aborted = pyqtSignal(str)
     
     def __init__(self):
         super().__init__()
@@ -225,8 +604,34 @@ class ScreenshotViewer(QMainWindow):
         
         # Scan variables
         self.scan_active = False
-        self.scan_future = None
-        self.executor = None
+        self.scan_task = None
+        self.scan_thread = None
+        self.scan_worker = None
+        
+        # Background ZIP export
+        self.export_thread = None
+        self.export_worker = None
+        
+        # Background thumbnail loading, driven by what is on screen
+        self.thumbnail_pool = QThreadPool(self)
+        self.thumbnail_pool.setMaxThreadCount(4)
+        self.thumbnail_signals = ThumbnailSignals(self)
+        self.thumbnail_signals.loaded.connect(self.on_thumbnail_loaded)
+        self.thumbnail_items = {}
+        self.pending_thumbnails = set()
+        self.queued_thumbnails = set()
+        self.thumbnail_generation = 0
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setSingleShot(True)
+        self.thumbnail_timer.setInterval(0)
+        self.thumbnail_timer.timeout.connect(self._request_visible_thumbs)
+        
+        # Throttled progress display
+        self.pending_progress = None
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setSingleShot(True)
+        self.progress_timer.setInterval(33)
+        self.progress_timer.timeout.connect(self.flush_progress)
         
         # Enhanced style with shadows and gradients
         self.setStyleSheet("""
@@ -394,9 +799,16 @@ class ScreenshotViewer(QMainWindow):
         """)
 
         self.output_dir = self.settings.value("output_dir", "screenshots")
-        self.history_file = "scan_history.json"
-        self.url_mapping_file = "url_mapping.json"
+        # One JSON line per scan, shared with the CLI; the JSON list is the old format
+        self.history_file = "scan_history.jsonl"
+        self.legacy_history_file = "scan_history.json"
+        # Mapping changes are appended to a JSONL log and folded into the JSON snapshot the CLI reads
+        self.url_mapping_file = "url_mapping.jsonl"
+        self.url_snapshot_file = "url_mapping.json"
+        self._mapping_log = None
         self.images = []
+        # Link shown for each entry of self.images, resolved once when it is listed
+        self.image_urls = []
         self.url_mapping = {}
         self.current_index = 0
         self.load_url_mapping()
@@ -405,7 +817,8 @@ class ScreenshotViewer(QMainWindow):
         self.connect_signals()
         self.scan_completed.connect(self.on_scan_completed)
         self.scan_progress.connect(self.update_progress)
-        self.scan_new_image.connect(self.add_new_image_to_list)
+        self.scan_new_images.connect(self.add_new_images_to_list)
+        self.scan_aborted.connect(self.on_scan_aborted)
 
     def setup_ui(self):
         """Setup the user interface"""
@@ -436,7 +849,12 @@ class ScreenshotViewer(QMainWindow):
         search_layout.setSpacing(5)
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Search by domain...")
-        self.search_input.textChanged.connect(self.filter_thumbnails)
+        # Debounced so fast typing filters once, not per keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(lambda: self.filter_thumbnails(self.search_input.text()))
+        self.search_input.textChanged.connect(self.search_timer.start)
         search_layout.addWidget(self.search_input)
         
         self.clear_search_btn = AnimatedButton("❌")
@@ -452,6 +870,11 @@ class ScreenshotViewer(QMainWindow):
         self.thumbnails_list.itemClicked.connect(self.thumbnail_clicked)
         self.thumbnails_list.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
         self.thumbnails_list.setAlternatingRowColors(True)
+        # Every row has the same icon and one line of text, so skip per-item size hints
+        self.thumbnails_list.setUniformItemSizes(True)
+        scroll_bar = self.thumbnails_list.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.thumbnail_timer.start)
+        scroll_bar.rangeChanged.connect(self.thumbnail_timer.start)
         left_layout.addWidget(self.thumbnails_list)
 
         # Controls
@@ -506,14 +929,20 @@ class ScreenshotViewer(QMainWindow):
         self.progress_label = QLabel("🚀 Ready to scan websites")
         self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.progress_label.setStyleSheet("""
-            color: #bbb; 
-            font-style: italic; 
-            font-size: 12px;
-            padding: 6px;
-            background-color: rgba(40, 40, 40, 180);
-            border-radius: 6px;
-            border: 1px solid #444;
-            font-weight: 500;
+            QLabel {
+                color: #bbb; 
+                font-style: italic; 
+                font-size: 12px;
+                padding: 6px;
+                background-color: rgba(40, 40, 40, 180);
+                border-radius: 6px;
+                border: 1px solid #444;
+                font-weight: 500;
+            }
+            QLabel[state="pulsing"] {
+                color: #66ccff; 
+                border: 1px solid #4a90e2;
+            }
         """)
         left_layout.addWidget(self.progress_label)
 
@@ -533,7 +962,9 @@ class ScreenshotViewer(QMainWindow):
         # URL link
         self.url_link = QTextBrowser()
         self.url_link.setMaximumHeight(45)
-        self.url_link.setOpenExternalLinks(True)
+        # Links are opened by open_link, after the click event has returned
+        self.url_link.setOpenLinks(False)
+        self.url_link.anchorClicked.connect(self.open_link)
         right_layout.addWidget(self.url_link)
 
         # Image viewer
@@ -582,6 +1013,21 @@ class ScreenshotViewer(QMainWindow):
                 font-family: 'Segoe UI', Arial, sans-serif;
             }
         """)
+        
+        # Feedback flash tints the status bar instead of restyling it
+        self.status_effect = QGraphicsColorizeEffect(self.status_bar)
+        self.status_effect.setColor(QColor(74, 144, 226))  # #4a90e2
+        self.status_effect.setStrength(0.0)
+        # Disabled while idle so ordinary repaints skip the offscreen effect pass
+        self.status_effect.setEnabled(False)
+        self.status_bar.setGraphicsEffect(self.status_effect)
+        self.status_animation = QPropertyAnimation(self.status_effect, b"strength", self)
+        self.status_animation.setDuration(1000)
+        self.status_animation.setStartValue(0.0)
+        self.status_animation.setKeyValueAt(0.5, 1.0)
+        self.status_animation.setEndValue(0.0)
+        self.status_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self.status_animation.finished.connect(lambda: self.status_effect.setEnabled(False))
 
         # Load existing captures
         self.load_captures()
@@ -679,18 +1125,9 @@ class ScreenshotViewer(QMainWindow):
 
     def animate_status_feedback(self):
         """Animate status bar feedback"""
-        original_style = self.status_bar.styleSheet()
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #4a90e2, stop: 1 #357abd);
-                color: white;
-                font-size: 11px;
-                border-top: 2px solid #2a75b3;
-                padding: 4px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-        """)
-        QTimer.singleShot(1000, lambda: self.status_bar.setStyleSheet(original_style))
+        self.status_animation.stop()
+        self.status_effect.setEnabled(True)
+        self.status_animation.start()
 
     def save_settings(self):
         """Save application settings"""
@@ -711,6 +1148,21 @@ class ScreenshotViewer(QMainWindow):
         """Handle application close event"""
         self.save_settings()
         self.save_url_mapping()
+        _log_buffer.flush()
+        if self.scan_thread is not None:
+            # In-flight captures are cancelled, so the thread ends promptly and must not outlive us
+            self.cancel_scan()
+            self.scan_thread.wait()
+        if self.export_thread is not None:
+            # Stop after the current file and drop the unfinished archive
+            self.export_worker.cancelled = True
+            self.export_thread.quit()
+            self.export_thread.wait()
+            if not self.export_worker.complete:
+                try:
+                    os.remove(self.export_worker.filename)
+                except OSError:
+                    pass
         event.accept()
 
     def start_scan(self):
@@ -738,9 +1190,25 @@ class ScreenshotViewer(QMainWindow):
         self.animate_scan_start()
 
         # Start scan in thread
-        self.scan_thread = threading.Thread(target=self.run_scan)
-        self.scan_thread.daemon = True
-        self.scan_thread.start()
+        worker = ScanWorker(self.run_scan)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        # Quit from the scan thread itself, so closeEvent's wait() doesn't need the GUI event loop
+        worker.finished.connect(thread.quit, Qt.ConnectionType.DirectConnection)
+        thread.finished.connect(lambda: self.on_scan_thread_finished(thread, worker))
+        self.scan_worker = worker
+        self.scan_thread = thread
+        thread.start()
+
+    def on_scan_thread_finished(self, thread, worker):
+        """Release a scan thread once it has stopped; a new scan may start only then"""
+        thread.deleteLater()
+        worker.deleteLater()
+        if self.scan_thread is thread:
+            self.scan_thread = None
+            self.scan_worker = None
+            self.start_scan_action.setEnabled(True)
 
     def animate_scan_start(self):
         """Animate scan start"""
@@ -753,15 +1221,27 @@ class ScreenshotViewer(QMainWindow):
 
     def stop_scan(self):
         """Stop the scanning process"""
-        self.scan_active = False
+        self.cancel_scan()
+        self.progress_timer.stop()
+        self.pending_progress = None
         self.status_bar.showMessage("🛑 Process stopped by user")
         self.progress_label.setText("⏹️ Process halted")
-        self.start_scan_action.setEnabled(True)
+        # Start is re-enabled once the scan thread has actually finished
         self.stop_scan_action.setEnabled(False)
         
         # Stop animation
         self.animate_scan_stop()
 
+    def cancel_scan(self):
+        """Stop the scan and cancel its coroutine on the scan thread's event loop"""
+        self.scan_active = False
+        task, self.scan_task = self.scan_task, None
+        if task is not None:
+            try:
+                task.get_loop().call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # The loop has already closed
+
     def animate_scan_stop(self):
         """Animate scan stop"""
         animation = QPropertyAnimation(self.progress_bar, b"value")
@@ -770,133 +1250,214 @@ class ScreenshotViewer(QMainWindow):
         animation.setEndValue(0)
         animation.start()
 
+    def find_urls_re(self):
+        """Return unique raw URL matches, regex-scanned straight over a memory map"""
+        with open(self.input_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return set()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Deduplicated here so repeated links are only parsed once
+                return {m.group(0) for m in _URL_RE.finditer(mm)}
+
+    def find_urls_hyperscan(self):
+        """Return unique raw URL matches, located by a Hyperscan prefix scan"""
+        global _URL_DB
+        if _URL_DB is None:
+            _URL_DB = hyperscan.Database()
+            _URL_DB.compile(
+                expressions=[_URL_PREFIX],
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+            )
+
+        # One callback per URL prefix; the regex then extends each hit in C
+        starts = []
+
+        def on_match(id, start, end, flags, context):
+            starts.append(start)
+
+        with open(self.input_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return set()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                _URL_DB.scan(mm, match_event_handler=on_match)
+
+                # Skip prefixes inside an earlier URL, as re.finditer would
+                matches = set()
+                last_end = -1
+                for start in starts:
+                    if start < last_end:
+                        continue
+                    match = _URL_RE.match(mm, start)
+                    if match:
+                        last_end = match.end()
+                        matches.add(match.group())
+                return matches
+
     def run_scan(self):
         """Run the scanning process"""
         def read_content():
             """Read content from file"""
             try:
-                with open(self.input_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    text = f.read()
-                urls = set()
-                # Extract URLs
-                for match in re.findall(r'https?://[^\s<>"{}|\\^`\[\]]+', text, re.IGNORECASE):
-                    try:
-                        parsed = urlparse(match)
-                        if parsed.netloc:
-                            urls.add(f"{parsed.scheme}://{parsed.netloc}")
-                    except:
-                        pass
-                return list(urls)
+                if hyperscan is not None:
+                    matches = self.find_urls_hyperscan()
+                else:
+                    matches = self.find_urls_re()
+                origins = set()
+                # Extract scheme and host only, without urlparse's full parse
+                for match in matches:
+                    origin = _ORIGIN_RE.match(match)
+                    if origin.group(2):
+                        origins.add(origin.group(1).lower() + b"://" + origin.group(2))
+                return list({origin.decode('utf-8', 'ignore') for origin in origins})
             except Exception as e:
                 print(f"Read error: {e}")
                 return []
 
-        def capture(url):
-            """Capture screenshot of URL"""
-            if not self.scan_active:
-                return False, url, "Process stopped"
-            
+        async def block_media(route):
+            """Block heavy resources"""
+            await route.abort()
+
+        def store_capture(filepath, data):
+            """Write the screenshot bytes and decode its thumbnail without rereading the file"""
+            with open(filepath, 'wb') as f:
+                f.write(data)
+            buffer = QBuffer()
+            buffer.setData(QByteArray(data))
+            thumbnail = ThumbnailLoader.read_scaled(QImageReader(buffer))
+            if not thumbnail.isNull():
+                ThumbnailLoader.save_cached(thumbnail, self._thumb_cache_path(filepath))
+            return thumbnail
+
+        async def capture(pool, url):
+            """Capture screenshot of URL in its own context of a pooled browser"""
             try:
-                with sync_playwright() as p:
-                    # Optimized browser launch
-                    browser = p.chromium.launch(
-                        headless=True,
-                        args=['--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage']
-                    )
+                async with pool.checkout() as browser:
+                    if not self.scan_active:
+                        return False, url, "Process stopped"
                     
                     # Optimized context
-                    context = browser.new_context(
+                    context = await browser.new_context(
                         viewport={'width': 1280, 'height': 800},
                         java_script_enabled=True,
                         bypass_csp=True,
                         accept_downloads=False
                     )
-                    
-                    # Block heavy resources
-                    def block_media(route):
-                        if any(ext in route.request.url for ext in 
-                              ['.mp4', '.avi', '.webm', '.mp3', '.wav', '.ogg']):
-                            route.abort()
-                        else:
-                            route.continue_()
-                    
-                    context.route("**/*", block_media)
-                    
-                    page = context.new_page()
-                    
-                    # Reduced timeouts for better performance
-                    page.goto(url, timeout=15000)
-                    page.wait_for_timeout(1000)
-
-                    safe_name = re.sub(r'[^\w\-_\.]', '_', urlparse(url).netloc)
-                    filepath = os.path.join(self.output_dir, f"{safe_name}.png")
-                    
-                    # Optimized screenshot
-                    page.screenshot(
-                        path=filepath,
-                        type='jpeg',
-                        quality=85,
-                        full_page=False
-                    )
-                    
-                    browser.close()
-                    return True, url, filepath
+                    try:
+                        # Only media URLs reach Python; everything else is never intercepted
+                        await context.route(_MEDIA_URL_RE, block_media)
+                        
+                        page = await context.new_page()
+                        
+                        # Don't wait for every subresource; give dynamic pages a bounded chance to settle
+                        await page.goto(url, timeout=15000, wait_until='domcontentloaded')
+                        try:
+                            await page.wait_for_load_state('networkidle', timeout=2000)
+                        except PlaywrightTimeoutError:
+                            pass
+
+                        safe_name = _UNSAFE_NAME_RE.sub('_', urlparse(url).netloc)
+                        filepath = os.path.join(self.output_dir, f"{safe_name}.jpg")
+                        
+                        # Optimized screenshot, kept in memory for the thumbnail
+                        data = await page.screenshot(
+                            type='jpeg',
+                            quality=85,
+                            full_page=False
+                        )
+                        thumbnail = await asyncio.get_running_loop().run_in_executor(None, store_capture, filepath, data)
+                        return True, url, (filepath, thumbnail)
+                    finally:
+                        await context.close()
             except Exception as e:
                 return False, url, str(e)
 
+        async def scan(total):
+            """Capture all URLs with a pool of browsers, returns the success count"""
+            successful_captures = 0
+            self.scan_task = asyncio.current_task()
+            async with async_playwright() as p:
+                # Browsers are launched once up front; the pool size bounds concurrency
+                pool = BrowserPool(p)
+                await pool.start()
+                tasks = [asyncio.ensure_future(capture(pool, url)) for url in self.urls]
+                
+                # New images are sent to the interface in batches
+                batch = []
+                last_percent = -1
+                done = reported = 0
+
+                def flush_progress():
+                    nonlocal last_percent, reported
+                    if reported != done:
+                        last_percent = done * 100 // total
+                        reported = done
+                        status_text = f"📊 Progress: {done}/{total} ({successful_captures} ✅ captured)"
+                        self.scan_progress.emit(last_percent, status_text)
+
+                def flush_batch():
+                    nonlocal batch
+                    if batch:
+                        self.scan_new_images.emit(batch)
+                        batch = []
+
+                async def flush_periodically():
+                    # Captures finished behind a slow URL still reach the list within 250ms,
+                    # along with counts held back while the percentage stood still
+                    while True:
+                        await asyncio.sleep(0.25)
+                        flush_batch()
+                        flush_progress()
+
+                flusher = asyncio.ensure_future(flush_periodically())
+                try:
+                    # Process results as they complete
+                    for i, next_result in enumerate(asyncio.as_completed(tasks)):
+                        if not self.scan_active:
+                            break
+                            
+                        success, url, result = await next_result
+                        if success:
+                            successful_captures += 1
+                            filepath, thumbnail = result
+                            batch.append((filepath, url, thumbnail))
+                        
+                        if len(batch) >= 16:
+                            flush_batch()
+                        
+                        # Progress crosses to the GUI thread only when the percentage moves,
+                        # and always for the last URL; update_progress coalesces repaints
+                        done = i + 1
+                        if done == total or done * 100 // total != last_percent:
+                            flush_progress()
+                finally:
+                    flusher.cancel()
+                    flush_batch()
+                    # Cancel remaining tasks
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    await pool.shutdown()
+            return successful_captures
+
         os.makedirs(self.output_dir, exist_ok=True)
         self.urls = read_content()
         total = len(self.urls)
         if total == 0:
+            self.scan_active = False
             self.scan_progress.emit(0, "⚠️ No valid URLs found in file")
-            self.status_bar.showMessage("❌ No URLs found to process")
-            self.start_scan_action.setEnabled(True)
-            self.stop_scan_action.setEnabled(False)
+            self.scan_aborted.emit("❌ No URLs found to process")
             return
 
-        # Optimized thread count
-        num_threads = min(4, os.cpu_count() or 1)
         successful_captures = 0
-        self.executor = ThreadPoolExecutor(max_workers=num_threads)
-        
         try:
-            # Submit all tasks
-            futures = [self.executor.submit(capture, url) for url in self.urls]
-            
-            # Process results as they complete
-            for i, future in enumerate(as_completed(futures)):
-                if not self.scan_active:
-                    # Cancel remaining tasks
-                    for f in futures[i:]:
-                        f.cancel()
-                    break
-                    
-                try:
-                    success, url, result = future.result(timeout=60)
-                    if success:
-                        self.images.append(result)
-                        self.url_mapping[os.path.basename(result)] = url
-                        successful_captures += 1
-                        # Emit signal to add image to interface
-                        self.scan_new_image.emit(result)
-                    
-                    progress = int((i + 1) / total * 100)
-                    status_text = f"📊 Progress: {i + 1}/{total} ({successful_captures} ✅ captured)"
-                    self.scan_progress.emit(progress, status_text)
-                    
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    progress = int((i + 1) / total * 100)
-                    status_text = f"📊 Progress: {i + 1}/{total} ({successful_captures} ✅ captured)"
-                    self.scan_progress.emit(progress, status_text)
-                    
+            successful_captures = asyncio.run(scan(total))
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             print(f"Scan error: {e}")
         finally:
-            self.executor.shutdown(wait=False)
+            self.scan_task = None
             
-        # Save mappings
-        self.save_url_mapping()
         self.save_to_history(len(self.urls), successful_captures)
         
         # Complete scan
@@ -904,57 +1465,90 @@ class ScreenshotViewer(QMainWindow):
         self.scan_completed.emit()
 
     def update_progress(self, value, text):
-        """Update progress bar and text"""
+        """Coalesce progress updates to at most ~30 repaints per second"""
+        self.pending_progress = (value, text)
+        if not self.progress_timer.isActive():
+            self.progress_timer.start()
+
+    def flush_progress(self):
+        """Apply the latest pending progress update"""
+        if self.pending_progress is None:
+            return
+        value, text = self.pending_progress
+        self.pending_progress = None
         self.progress_bar.setValue(value)
         self.progress_label.setText(text)
         
         # Pulse effect during scan
-        if 0 < value < 100:
-            self.progress_label.setStyleSheet("""
-                color: #66ccff; 
-                font-style: italic; 
-                font-size: 12px;
-                padding: 6px;
-                background-color: rgba(40, 40, 40, 180);
-                border-radius: 6px;
-                border: 1px solid #4a90e2;
-                font-weight: 500;
-            """)
+        self.set_style_state(self.progress_label, "pulsing" if 0 < value < 100 else "idle")
 
-    def add_new_image_to_list(self, filepath):
-        """Add new image to list in real-time"""
-        filename = os.path.basename(filepath)
-        
-        # Create list item
-        item = ThumbnailItem(filepath)
+    def set_style_state(self, widget, state):
+        """Switch a widget between its stylesheet's [state=...] rules"""
+        if widget.property("state") == state:
+            return
+        widget.setProperty("state", state)
+        # Re-match the existing rules; the stylesheet itself is not reparsed
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+    def add_new_images_to_list(self, captures):
+        """Add a batch of (filepath, url, thumbnail) captures to the list in real-time"""
+        first_images = not self.images
+        filepaths = [filepath for filepath, _, _ in captures]
+        self.images.extend(filepaths)
+        self.image_urls.extend(url for _, url, _ in captures)
+        items = []
+        for filepath, url, thumbnail in captures:
+            self.append_url_mapping(os.path.basename(filepath), url)
+            # Thumbnails decoded from the capture bytes go straight into the cache
+            try:
+                mtime = os.path.getmtime(filepath)
+            except OSError:
+                mtime = 0
+            if not thumbnail.isNull():
+                QPixmapCache.insert(ThumbnailItem.cache_key(filepath, mtime), QPixmap.fromImage(thumbnail))
+            items.append(self.create_thumbnail_item(filepath, mtime))
         
-        # Add to list with animation
-        self.thumbnails_list.addItem(item)
+        # One layout pass for the whole batch
+        self.insert_thumbnail_items(items)
         
         # Animate appearance
-        self.animate_thumbnail_appear(item)
+        self.animate_thumbnails_appear(filepaths)
         
         # Update navigation if first image
-        if len(self.images) == 1:
+        if first_images:
             self.current_index = 0
             self.show_current_image()
             self.update_navigation()
 
-    def animate_thumbnail_appear(self, item):
-        """Animate thumbnail appearance"""
-        # Simple visual feedback
-        row = self.thumbnails_list.row(item)
-        if row >= 0:
-            # Temporary style change
-            original_bg = item.background()
-            item.setBackground(QColor(74, 144, 226, 150))  # Blue with transparency
-            QTimer.singleShot(300, lambda: item.setBackground(original_bg))
+    def animate_thumbnails_appear(self, filepaths):
+        """Animate thumbnail appearance for a batch with a single timer"""
+        # Temporary style change
+        highlight = QColor(74, 144, 226, 150)  # Blue with transparency
+        for filepath in filepaths:
+            self.thumbnail_items[filepath].setBackground(highlight)
+        QTimer.singleShot(300, lambda: self.restore_thumbnails_background(filepaths))
+
+    def restore_thumbnails_background(self, filepaths):
+        """End the appearance highlight of items still in the list"""
+        for filepath in filepaths:
+            item = self.thumbnail_items.get(filepath)
+            if item is not None:
+                item.setBackground(QColor(60, 60, 60, 100))
+
+    def on_scan_aborted(self, message):
+        """Handle a scan that could not start"""
+        self.status_bar.showMessage(message)
+        self.stop_scan_action.setEnabled(False)
 
     def on_scan_completed(self):
         """Handle scan completion"""
+        # Publish the new captures to the CLI's snapshot
+        self.save_url_mapping()
+        self.progress_timer.stop()
+        self.flush_progress()
         self.progress_label.setText("🎉 Process completed successfully!")
         self.status_bar.showMessage("✅ All websites captured! Ready for review")
-        self.start_scan_action.setEnabled(True)
         self.stop_scan_action.setEnabled(False)
         self.update_navigation()
         
@@ -963,70 +1557,146 @@ class ScreenshotViewer(QMainWindow):
 
     def animate_scan_complete(self):
         """Animate scan completion"""
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                height: 14px;
-                border-radius: 7px;
-                background-color: #333;
-                border: 1px solid #444;
-                text-align: center;
-                font-size: 9px;
-                color: #fff;
-                font-weight: 500;
-            }
-            QProgressBar::chunk {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, 
-                    stop: 0 #5cb85c, 
-                    stop: 0.5 #4cae4c,
-                    stop: 1 #5cb85c);
-                border-radius: 7px;
-            }
-        """)
-        QTimer.singleShot(2000, lambda: self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                height: 14px;
-                border-radius: 7px;
-                background-color: #333;
-                border: 1px solid #444;
-                text-align: center;
-                font-size: 9px;
-                color: #fff;
-                font-weight: 500;
-            }
-            QProgressBar::chunk {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, 
-                    stop: 0 #4a90e2, 
-                    stop: 0.5 #5cb85c,
-                    stop: 1 #5cb85c);
-                border-radius: 7px;
-            }
-        """))
+        self.set_style_state(self.progress_bar, "complete")
+        QTimer.singleShot(2000, lambda: self.set_style_state(self.progress_bar, "idle"))
 
     def load_captures(self):
         """Load existing captures"""
         self.images.clear()
+        self.image_urls.clear()
         self.thumbnails_list.clear()
+        self.thumbnail_items.clear()
+        self.pending_thumbnails.clear()
+        self.queued_thumbnails.clear()
         
+        mtimes = {}
         if os.path.exists(self.output_dir):
-            # Load all image files
-            files = [f for f in os.listdir(self.output_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))]
-            self.images = sorted([os.path.join(self.output_dir, f) for f in files])
-
-        # Add thumbnails
-        for img_path in self.images:
-            item = ThumbnailItem(img_path)
-            self.thumbnails_list.addItem(item)
+            # Load all image files, reusing the stat data scandir already has
+            with os.scandir(self.output_dir) as it:
+                for entry in it:
+                    if entry.name.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')) and entry.is_file():
+                        mtimes[entry.path] = entry.stat().st_mtime
+            self.images = sorted(mtimes)
+            self.image_urls = [self.url_for_image(path) for path in self.images]
+            self.clean_thumbnail_cache()
+
+        # Add thumbnails in one layout pass
+        items = [self.create_thumbnail_item(img_path, mtimes[img_path]) for img_path in self.images]
+        self.insert_thumbnail_items(items)
 
         self.update_navigation()
         if self.images:
             self.current_index = 0
             self.show_current_image()
 
+    def url_for_image(self, path):
+        """Return the mapped URL for a capture, or one derived from its filename"""
+        filename = os.path.basename(path)
+        return self.url_mapping.get(filename) or f"https://{os.path.splitext(filename)[0]}"
+
+    def insert_thumbnail_items(self, items):
+        """Append prebuilt items with repaints and widget signals suspended"""
+        self.thumbnails_list.setUpdatesEnabled(False)
+        self.thumbnails_list.blockSignals(True)
+        try:
+            for item in items:
+                self.thumbnails_list.addItem(item)
+        finally:
+            self.thumbnails_list.blockSignals(False)
+            self.thumbnails_list.setUpdatesEnabled(True)
+
+    def create_thumbnail_item(self, filepath, mtime=None):
+        """Create a list item; its thumbnail loads once it scrolls into view"""
+        item = ThumbnailItem(filepath, mtime=mtime)
+        # Lowercased search key computed once instead of per keystroke
+        domain = _domain_of(self.url_mapping.get(item.filename, ""))
+        item.search_key = f"{domain} {item.filename.lower()}"
+        self.thumbnail_items[filepath] = item
+        if item.needs_thumbnail:
+            self.pending_thumbnails.add(filepath)
+            self.thumbnail_timer.start()
+        return item
+
+    def _request_visible_thumbs(self):
+        """Queue thumbnails for the visible rows plus a small buffer"""
+        # Jobs queued for the previous viewport become stale
+        self.thumbnail_generation += 1
+        self.pending_thumbnails |= self.queued_thumbnails
+        self.queued_thumbnails = set()
+        if not self.pending_thumbnails:
+            return
+            
+        viewport = self.thumbnails_list.viewport()
+        top = self.thumbnails_list.itemAt(5, 5)
+        if top is None:
+            return
+        bottom = self.thumbnails_list.itemAt(5, viewport.height() - 5)
+        first = max(0, self.thumbnails_list.row(top) - 2)
+        last = self.thumbnails_list.count() - 1
+        if bottom is not None:
+            last = min(last, self.thumbnails_list.row(bottom) + 2)
+            
+        for row in range(first, last + 1):
+            item = self.thumbnails_list.item(row)
+            if item.isHidden() or item.filepath not in self.pending_thumbnails:
+                continue
+            self.pending_thumbnails.discard(item.filepath)
+            # Already shown, e.g. its job finished just before this request
+            if not item.needs_thumbnail:
+                continue
+            self.queued_thumbnails.add(item.filepath)
+            self.thumbnail_pool.start(ThumbnailLoader(
+                item.filepath, item.mtime, item.thumbnail_key, self._thumb_cache_path(item.filepath),
+                self.thumbnail_signals, self.thumbnail_generation, self.current_thumbnail_generation
+            ))
+
+    def current_thumbnail_generation(self):
+        """Generation of the latest visible-thumbnail request"""
+        return self.thumbnail_generation
+
+    def _thumb_cache_path(self, filepath):
+        """Path of the on-disk thumbnail for an image"""
+        digest = hashlib.sha1(filepath.encode()).hexdigest()
+        return os.path.join(self.output_dir, ".thumbs", digest + ".png")
+
+    def clean_thumbnail_cache(self):
+        """Drop on-disk thumbnails whose source image is gone"""
+        thumbs_dir = os.path.join(self.output_dir, ".thumbs")
+        if not os.path.isdir(thumbs_dir):
+            return
+        wanted = {os.path.basename(self._thumb_cache_path(p)) for p in self.images}
+        for name in os.listdir(thumbs_dir):
+            if name not in wanted:
+                try:
+                    os.remove(os.path.join(thumbs_dir, name))
+                except OSError:
+                    pass
+
+    def on_thumbnail_loaded(self, filepath, key, image):
+        """Cache a thumbnail decoded in the background and show it"""
+        self.queued_thumbnails.discard(filepath)
+        self.pending_thumbnails.discard(filepath)
+        if image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        item = self.thumbnail_items.get(filepath)
+        if item is not None and item.thumbnail_key == key:
+            item.setIcon(QIcon(pixmap))
+            item.needs_thumbnail = False
+
     def filter_thumbnails(self, text):
-        """Filter thumbnails by text"""
+        """Filter thumbnails by domain or file name"""
+        needle = text.lower()
+        self.thumbnails_list.setUpdatesEnabled(False)
         for i in range(self.thumbnails_list.count()):
             item = self.thumbnails_list.item(i)
-            item.setHidden(text.lower() not in item.text().lower() if text else False)
+            # Plain attribute lookup, and only touch items whose state changes
+            hidden = bool(needle) and needle not in item.search_key
+            if item.isHidden() != hidden:
+                item.setHidden(hidden)
+        self.thumbnails_list.setUpdatesEnabled(True)
+        self.thumbnail_timer.start()
 
     def thumbnail_clicked(self, item):
         """Handle thumbnail click"""
@@ -1051,18 +1721,12 @@ class ScreenshotViewer(QMainWindow):
         """Show current image"""
         if 0 <= self.current_index < len(self.images):
             path = self.images[self.current_index]
-            pixmap = QPixmap(path)
+            pixmap = self.image_viewer.load_image(path)
             if not pixmap.isNull():
-                self.image_viewer.set_image(pixmap)
+                neighbours = (self.current_index - 1, self.current_index + 1)
+                self.image_viewer.preload([self.images[i] for i in neighbours if 0 <= i < len(self.images)])
                 filename = os.path.basename(path)
-                
-                # Extract URL from filename
-                if filename in self.url_mapping:
-                    url = self.url_mapping[filename]
-                else:
-                    # Generate URL from filename
-                    domain = filename.replace('.png', '').replace('.jpg', '').replace('.jpeg', '').replace('.gif', '').replace('.bmp', '')
-                    url = f"https://{domain}"
+                url = self.image_urls[self.current_index]
                 
                 self.image_info.setText(f"📄 {filename}")
                 
@@ -1083,6 +1747,10 @@ class ScreenshotViewer(QMainWindow):
             self.image_info.setText("📭 No image selected")
             self.url_link.setHtml("")
 
+    def open_link(self, url):
+        """Open a clicked link in the system browser"""
+        QTimer.singleShot(0, lambda: QDesktopServices.openUrl(url))
+
     def update_navigation(self):
         """Update navigation buttons"""
         has_images = len(self.images) > 0
@@ -1138,11 +1806,14 @@ class ScreenshotViewer(QMainWindow):
                 os.remove(path)
                 # Remove from mapping
                 if filename in self.url_mapping:
-                    del self.url_mapping[filename]
-                    self.save_url_mapping()
+                    self.append_url_mapping(filename, None)
+                    self.flush_url_mapping()
                 
                 # Update lists
                 del self.images[self.current_index]
+                del self.image_urls[self.current_index]
+                self.thumbnail_items.pop(path, None)
+                self.pending_thumbnails.discard(path)
                 
                 # Update display
                 self.thumbnails_list.takeItem(self.current_index)
@@ -1181,14 +1852,41 @@ class ScreenshotViewer(QMainWindow):
         )
         
         if filename:
-            try:
-                with zipfile.ZipFile(filename, 'w') as zipf:
-                    for img_path in self.images:
-                        zipf.write(img_path, os.path.basename(img_path))
-                self.status_bar.showMessage(f"✅ ZIP export successful: {filename}")
-                self.animate_status_feedback()
-            except Exception as e:
-                self.show_error(f"Error during ZIP export: {str(e)}")
+            if self.export_thread is not None:
+                self.show_error("A ZIP export is already running")
+                return
+                
+            self.export_worker = ZipExportWorker(filename, self.images)
+            self.export_thread = QThread(self)
+            self.export_worker.moveToThread(self.export_thread)
+            self.export_thread.started.connect(self.export_worker.run)
+            self.export_worker.progress.connect(self.on_zip_export_progress)
+            self.export_worker.finished.connect(self.on_zip_export_finished)
+            self.export_worker.failed.connect(self.on_zip_export_failed)
+            self.export_thread.finished.connect(self.on_zip_export_cleanup)
+            self.export_thread.start()
+
+    def on_zip_export_progress(self, done, total):
+        """Show ZIP export progress"""
+        self.status_bar.showMessage(f"📦 Exporting ZIP... {done}/{total}")
+
+    def on_zip_export_finished(self, filename):
+        """Handle ZIP export success"""
+        self.export_thread.quit()
+        self.status_bar.showMessage(f"✅ ZIP export successful: {filename}")
+        self.animate_status_feedback()
+
+    def on_zip_export_failed(self, error):
+        """Handle ZIP export failure"""
+        self.export_thread.quit()
+        self.show_error(f"Error during ZIP export: {error}")
+
+    def on_zip_export_cleanup(self):
+        """Release the export thread once it has stopped"""
+        self.export_thread.deleteLater()
+        self.export_worker.deleteLater()
+        self.export_thread = None
+        self.export_worker = None
 
     def export_to_pdf(self):
         """Export images to PDF"""
@@ -1209,27 +1907,32 @@ class ScreenshotViewer(QMainWindow):
                 c = canvas.Canvas(filename, pagesize=letter)
                 width, height = letter
                 
-                for i, img_path in enumerate(self.images):
-                    # New page for each image
-                    if i > 0:
-                        c.showPage()
-                    
-                    # Add image
-                    try:
-                        img = ImageReader(img_path)
-                        img_width, img_height = img.getSize()
-                        # Adjust size for page
-                        scale = min(width/img_width, height/img_height) * 0.8
-                        new_width = img_width * scale
-                        new_height = img_height * scale
-                        x = (width - new_width) / 2
-                        y = (height - new_height) / 2
-                        c.drawImage(img, x, y, new_width, new_height)
+                # Pages are decoded and downscaled in parallel, drawn in order
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    page_images = executor.map(
+                        lambda path: self.pdf_page_image(path, width * 0.8, height * 0.8), self.images
+                    )
+                    for i, (img_path, page_image) in enumerate(zip(self.images, page_images)):
+                        # New page for each image
+                        if i > 0:
+                            c.showPage()
                         
-                        # Add filename
-                        c.drawString(50, 50, os.path.basename(img_path))
-                    except:
-                        c.drawString(50, height-50, f"Unable to load: {os.path.basename(img_path)}")
+                        # Add image
+                        try:
+                            data, img_width, img_height = page_image
+                            img = ImageReader(BytesIO(data))
+                            # Adjust size for page
+                            scale = min(width/img_width, height/img_height) * 0.8
+                            new_width = img_width * scale
+                            new_height = img_height * scale
+                            x = (width - new_width) / 2
+                            y = (height - new_height) / 2
+                            c.drawImage(img, x, y, new_width, new_height)
+                            
+                            # Add filename
+                            c.drawString(50, 50, os.path.basename(img_path))
+                        except:
+                            c.drawString(50, height-50, f"Unable to load: {os.path.basename(img_path)}")
                 
                 c.save()
                 self.status_bar.showMessage(f"✅ PDF export successful: {filename}")
@@ -1237,6 +1940,29 @@ class ScreenshotViewer(QMainWindow):
             except Exception as e:
                 self.show_error(f"Error during PDF export: {str(e)}")
 
+    def pdf_page_image(self, img_path, max_width, max_height):
+        """Decode an image at page resolution and re-encode it as a small JPEG"""
+        try:
+            reader = QImageReader(img_path)
+            size = reader.size()
+            if not size.isValid():
+                return None
+            # 150 DPI is plenty for a catalog; PDF units are 1/72 inch
+            bounds = QSize(int(max_width * 150 / 72), int(max_height * 150 / 72))
+            reader.setScaledSize(size.scaled(bounds, Qt.AspectRatioMode.KeepAspectRatio).boundedTo(size))
+            image = reader.read()
+            if image.isNull():
+                return None
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+            image.convertToFormat(QImage.Format.Format_RGB888).save(buffer, "JPEG", 80)
+            buffer.close()
+            return bytes(data), size.width(), size.height()
+        except Exception as e:
+            logging.debug(f"PDF page image error: {e}")
+            return None
+
     def toggle_fullscreen(self):
         """Toggle fullscreen mode"""
         if self.isFullScreen():
@@ -1288,9 +2014,7 @@ class ScreenshotViewer(QMainWindow):
         history_window.show()
 
     def save_to_history(self, total_urls, successful):
-        """Save to history"""
-        history = self.load_history()
-        
+        """Append scan to history"""
         entry = {
             "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "input_file": getattr(self, 'input_file', 'Unknown'),
@@ -1299,43 +2023,159 @@ class ScreenshotViewer(QMainWindow):
             "successful": successful
         }
         
-        history.insert(0, entry)  # Add to beginning
-        # Keep only last 20
-        history = history[:20]
-        
+        self.migrate_history()
+        # One compact line per scan; nothing already written is touched
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(history, f, indent=2)
+            with open(self.history_file, 'ab') as f:
+                f.write(self.dump_json(entry) + b'\n')
+                size = f.tell()
+            # Roughly 100 entries: trim the log back to the ones that are shown
+            if size > 16 * 1024:
+                with open(self.history_file, 'rb') as f:
+                    lines = deque(f, maxlen=20)
+                self.write_atomic(self.history_file, b''.join(lines))
         except Exception as e:
             print(f"History save error: {e}")
 
     def load_history(self):
-        """Load history"""
+        """Load the last 20 scans, newest first"""
+        self.migrate_history()
+        history = []
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
+                with open(self.history_file, 'rb') as f:
+                    lines = deque(f, maxlen=20)  # Keep last 20
+                for line in reversed(lines):
+                    try:
+                        history.append(json.loads(line))
+                    except ValueError:
+                        pass  # Skip a line cut short by an interrupted write
         except Exception as e:
             print(f"History load error: {e}")
-        return []
+        return history
+
+    def migrate_history(self):
+        """Convert the legacy JSON history list into the log if the log doesn't exist yet"""
+        if os.path.exists(self.history_file) or not os.path.exists(self.legacy_history_file):
+            return
+        try:
+            # The legacy list is newest first; the log is appended oldest first
+            history = self.read_json(self.legacy_history_file)
+            self.write_atomic(self.history_file, b''.join(self.dump_json(entry) + b'\n' for entry in reversed(history)))
+        except Exception as e:
+            print(f"History migration error: {e}")
+
+    def read_json(self, path):
+        """Parse a JSON file straight from a read-only memory map"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"{path} is empty")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if orjson is not None:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+                return json.loads(mm[:])
+
+    def dump_json(self, data):
+        """Serialize data to compact JSON bytes"""
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    def write_atomic(self, path, payload):
+        """Write bytes to a temp file and atomically swap it in"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    def append_url_mapping(self, filename, url):
+        """Record one mapping change (url None removes it) in the append log"""
+        if url is None:
+            self.url_mapping.pop(filename, None)
+        else:
+            self.url_mapping[filename] = url
+        try:
+            if self._mapping_log is None:
+                self._mapping_log = open(self.url_mapping_file, 'ab', buffering=1 << 16)
+            self._mapping_log.write(self.dump_json({"file": filename, "url": url}) + b"\n")
+            self._mapping_log_lines += 1
+        except OSError as e:
+            print(f"Mapping save error: {e}")
+            
+        # Compact once superseded lines outnumber live entries
+        if self._mapping_log_lines > 2 * len(self.url_mapping) + 100:
+            self.save_url_mapping()
+
+    def flush_url_mapping(self):
+        """Push buffered mapping lines to disk"""
+        try:
+            if self._mapping_log is not None:
+                self._mapping_log.flush()
+        except OSError as e:
+            print(f"Mapping save error: {e}")
+
+    def close_url_mapping_log(self):
+        """Flush and close the mapping log"""
+        try:
+            if self._mapping_log is not None:
+                self._mapping_log.close()
+        except OSError as e:
+            print(f"Mapping save error: {e}")
+        self._mapping_log = None
 
     def save_url_mapping(self):
-        """Save URL mapping"""
+        """Fold the logged changes into the JSON snapshot shared with the CLI, then empty the log"""
+        self.close_url_mapping_log()
+        # Re-read the snapshot so captures the CLI made meanwhile are kept
+        mapping = self.read_url_snapshot()
+        self.replay_url_mapping_log(mapping)
         try:
-            with open(self.url_mapping_file, 'w') as f:
-                json.dump(self.url_mapping, f, indent=2)
+            self.write_atomic(self.url_snapshot_file, self.dump_json(mapping))
+            self.write_atomic(self.url_mapping_file, b"")
+            self.url_mapping = mapping
+            self._mapping_log_lines = 0
         except Exception as e:
             print(f"Mapping save error: {e}")
 
-    def load_url_mapping(self):
-        """Load URL mapping"""
+    def read_url_snapshot(self):
+        """Return the mapping stored in the shared JSON snapshot"""
         try:
-            if os.path.exists(self.url_mapping_file):
-                with open(self.url_mapping_file, 'r') as f:
-                    self.url_mapping = json.load(f)
+            if os.path.exists(self.url_snapshot_file):
+                return self.read_json(self.url_snapshot_file)
         except Exception as e:
             print(f"Mapping load error: {e}")
-            self.url_mapping = {}
+        return {}
+
+    def replay_url_mapping_log(self, mapping):
+        """Apply the logged changes to mapping, returning how many were applied"""
+        loads = orjson.loads if orjson is not None else json.loads
+        applied = 0
+        try:
+            if os.path.exists(self.url_mapping_file):
+                with open(self.url_mapping_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            record = loads(line)
+                            filename, url = record["file"], record["url"]
+                        except (ValueError, KeyError, TypeError):
+                            # Torn or foreign line, e.g. after a crash mid-write
+                            continue
+                        applied += 1
+                        if url is None:
+                            mapping.pop(filename, None)
+                        else:
+                            mapping[filename] = url
+        except OSError as e:
+            print(f"Mapping load error: {e}")
+        return applied
+
+    def load_url_mapping(self):
+        """Load URL mapping: the shared JSON snapshot, then any log left by an unclean exit"""
+        self.url_mapping = self.read_url_snapshot()
+        self._mapping_log_lines = self.replay_url_mapping_log(self.url_mapping)
+        if self._mapping_log_lines:
+            self.save_url_mapping()
 
     def show_error(self, msg):
         """Show error message"""
@@ -1349,6 +2189,9 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyle("Fusion")  # Modern style
     
+    # Bound the shared pixmap cache used for thumbnails (in KB)
+    QPixmapCache.setCacheLimit(256 * 1024)
+    
     # Gray gradient palette
     palette = app.palette()
     palette.setColor(palette.ColorRole.Window, QColor(45, 45, 45))